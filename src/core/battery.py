@@ -2,13 +2,74 @@
 Core battery management and state tracking functionality
 """
 import numpy as np
+import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Union, Any
+from typing import Dict, List, Optional, Union, Any
+
+# Hourly consumption multipliers per usage pattern as (weekday, weekend)
+# tables indexed by hour of day
+_HOURLY_FACTORS = {
+    "Flat": (
+        np.array([0.3] * 7 + [2.0] * 3 + [0.8] * 7 + [2.5] * 6 + [0.8]),
+        np.array([0.4] * 8 + [1.5] * 11 + [1.8] * 4 + [0.4]),
+    ),
+    "Night-heavy": (
+        np.array([0.8] * 7 + [1.0] * 10 + [2.5] * 6 + [1.0]),
+        np.array([0.8] * 9 + [1.0] * 4 + [1.8] * 11),
+    ),
+    "Day-heavy": (
+        np.array([0.3] * 7 + [1.2] * 3 + [1.4] * 7 + [2.0] * 6 + [1.4]),
+        np.array([0.4] * 9 + [1.8] * 4 + [1.5] * 10 + [0.4]),
+    ),
+}
+
+_HOURS = np.arange(24)
+
+
+def _hourly_factor(hour: Union[int, np.ndarray], is_weekend: bool,
+                   usage_pattern: str) -> Union[float, np.ndarray]:
+    """Look up the consumption multiplier for an hour or an array of hours"""
+    weekday_factors, weekend_factors = _HOURLY_FACTORS.get(
+        usage_pattern, _HOURLY_FACTORS["Flat"])
+    factors = weekend_factors if is_weekend else weekday_factors
+    return factors[hour]
+
+
+# Battery fields packed into arrays for fleet-wide calculations
+_PACKED_FIELDS = ('capacity', 'min_soc', 'max_soc', 'charge_rate',
+                  'current_soc')
+
+
+def available_capacity_vec(pack: Dict[str, np.ndarray]) -> np.ndarray:
+    """Get available charging capacity of each packed battery"""
+    return pack['capacity'] * (pack['max_soc'] - pack['current_soc'])
+
+
+def can_charge_vec(pack: Dict[str, np.ndarray],
+                   amounts: np.ndarray) -> np.ndarray:
+    """Check per packed battery if it can be charged with given amount"""
+    return (pack['current_soc'] +
+            (amounts / pack['capacity'])) <= pack['max_soc']
+
+
+def can_discharge_vec(pack: Dict[str, np.ndarray],
+                      amounts: np.ndarray) -> np.ndarray:
+    """Check per packed battery if it can be discharged with given amount"""
+    return (pack['current_soc'] -
+            (amounts / pack['capacity'])) >= pack['min_soc']
 
 
 class Battery:
     """Battery energy storage system simulation and management"""
 
+    __slots__ = ('capacity', 'empty_soc', 'min_soc', 'max_soc', 'charge_rate',
+                 'profile_name', 'daily_consumption', 'usage_pattern',
+                 'yearly_consumption', 'monthly_distribution',
+                 '_monthly_array', 'surcharge_rate', '_surcharge_rate_f',
+                 'max_daily_cycles', 'max_watt_peak', 'look_ahead_hours',
+                 'pv_efficiency', 'current_soc', 'min_profit',
+                 '_current_power', '_daily_cycles', '_last_reset_ordinal')
+
     def __init__(self,
                  capacity: float,
                  empty_soc: float,
@@ -50,7 +111,12 @@ class Battery:
             11: 1.0,
             12: 1.15
         }
+        # Seasonal factors indexed by month number, index 0 is unused
+        self._monthly_array = np.array(
+            [1.0] +
+            [self.monthly_distribution.get(m, 1.0) for m in range(1, 13)])
         self.surcharge_rate = round(float(surcharge_rate), 3)
+        self._surcharge_rate_f = float(self.surcharge_rate)
         self.max_daily_cycles = max_daily_cycles
         self.max_watt_peak = float(max_watt_peak)
         self.look_ahead_hours = look_ahead_hours
@@ -59,14 +125,25 @@ class Battery:
         self.min_profit = 3 * surcharge_rate
         self._current_power = 0.0
         self._daily_cycles = 0.0
-        self._last_reset = datetime.now().date()
+        self._last_reset_ordinal = datetime.now().toordinal()
+
+    @classmethod
+    def pack(cls, batteries: List['Battery']) -> Dict[str, np.ndarray]:
+        """Pack the state of multiple batteries into arrays per field"""
+        return {
+            field: np.array([getattr(battery, field) for battery in batteries],
+                            dtype=np.float64)
+            for field in _PACKED_FIELDS
+        }
 
-    def _reset_daily_counters_if_needed(self) -> None:
+    def _reset_daily_counters_if_needed(self,
+                                        now: Optional[datetime] = None
+                                        ) -> None:
         """Reset daily counters if it's a new day"""
-        current_date = datetime.now().date()
-        if current_date > self._last_reset:
+        today = (now or datetime.now()).toordinal()
+        if today > self._last_reset_ordinal:
             self._daily_cycles = 0.0
-            self._last_reset = current_date
+            self._last_reset_ordinal = today
 
     def get_available_capacity(self) -> float:
         """Get available capacity for charging"""
@@ -86,7 +163,7 @@ class Battery:
 
     def get_seasonal_factor(self, month: int) -> float:
         """Get seasonal adjustment factor for given month"""
-        return self.monthly_distribution.get(month, 1.0)
+        return self._monthly_array[month] if 1 <= month <= 12 else 1.0
 
     def get_daily_consumption_for_date(self,
                                        date: Optional[datetime] = None
@@ -105,80 +182,70 @@ class Battery:
         if date is None:
             date = datetime.now()
 
-        if hour > 24:
-            date = date + timedelta(days=int(hour / 24))
-            hour = hour % 24
+        # Hours outside 0-23 roll over into the previous or next days
+        days, hour = divmod(int(hour), 24)
+        if days:
+            date = date + timedelta(days=days)
 
         daily = self.get_daily_consumption_for_date(date) / 24.0
-        is_weekend = date.weekday() >= 5
-
-        if self.usage_pattern == "Night-heavy":
-            if not is_weekend:
-                if 7 <= hour <= 9:
-                    return daily * 1.0
-                elif 17 <= hour <= 22:
-                    return daily * 2.5
-                elif 0 <= hour <= 6:
-                    return daily * 0.8
-                else:
-                    return daily * 1
-            else:
-                if 9 <= hour <= 12:
-                    return daily * 1
-                elif 13 <= hour <= 24:
-                    return daily * 1.8
-                else:
-                    return daily * 0.8
-        elif self.usage_pattern == "Day-heavy":
-            if not is_weekend:
-                if 7 <= hour <= 9:
-                    return daily * 1.2
-                elif 17 <= hour <= 22:
-                    return daily * 2.0
-                elif 0 <= hour <= 6:
-                    return daily * 0.3
-                else:
-                    return daily * 1.4
-            else:
-                if 9 <= hour <= 12:
-                    return daily * 1.8
-                elif 13 <= hour <= 22:
-                    return daily * 1.5
-                else:
-                    return daily * 0.4
-        # Default is Flat
-        if not is_weekend:
-            if 7 <= hour <= 9:
-                return daily * 2.0
-            elif 17 <= hour <= 22:
-                return daily * 2.5
-            elif 0 <= hour <= 6:
-                return daily * 0.3
-            else:
-                return daily * 0.8
-        else:
-            if 8 <= hour <= 18:
-                return daily * 1.5
-            elif 18 <= hour <= 22:
-                return daily * 1.8
-            else:
-                return daily * 0.4
-
-    def get_current_power(self) -> float:
-        """Get current power flow (positive for charging, negative for discharging)"""
-        hour = datetime.now().hour
-        consumption = self.get_hourly_consumption(hour)
+        return daily * self.get_hourly_factor(hour, date.weekday() >= 5)
 
+    def get_hourly_consumption_array(self,
+                                     date: Optional[datetime] = None
+                                     ) -> np.ndarray:
+        """Calculate consumption for all 24 hours of the given date"""
+        if date is None:
+            date = datetime.now()
+
+        daily = self.get_daily_consumption_for_date(date) / 24.0
+        return daily * self.get_hourly_factor(_HOURS, date.weekday() >= 5)
+
+    def get_hourly_consumption_range(self,
+                                     start: Optional[datetime] = None,
+                                     hours: int = 24) -> np.ndarray:
+        """Calculate hourly consumption for a number of hours from start"""
+        if start is None:
+            start = datetime.now()
+
+        return self.get_hourly_consumption_for_dates(
+            pd.date_range(start=start, periods=hours, freq='h'))
+
+    def get_hourly_consumption_for_dates(self,
+                                         dates: pd.DatetimeIndex
+                                         ) -> np.ndarray:
+        """Calculate hourly consumption for each timestamp of a date index"""
+        dates = pd.DatetimeIndex(dates)
+        hours = dates.hour.to_numpy()
+        factors = np.where(dates.weekday.to_numpy() < 5,
+                           self.get_hourly_factor(hours, False),
+                           self.get_hourly_factor(hours, True))
+        daily = (self.yearly_consumption /
+                 365.0) * self._monthly_array[dates.month.to_numpy()]
+        return daily / 24.0 * factors
+
+    def get_hourly_factor(self, hour: Union[int, np.ndarray],
+                          is_weekend: bool) -> Union[float, np.ndarray]:
+        """Get usage pattern multiplier for an hour or an array of hours"""
+        return _hourly_factor(hour, is_weekend, self.usage_pattern)
+
+    def get_current_power(self, now: Optional[datetime] = None) -> float:
+        """Get current power flow (positive for charging, negative for discharging)"""
         if self.current_soc <= self.min_soc:
             return 0.0
-        elif self.current_soc < 0.3:  # Low SOC condition
-            return min(self.charge_rate, self.get_available_capacity())
+
+        if now is None:
+            now = datetime.now()
+        hour = now.hour
+        consumption = self.get_hourly_consumption(hour, now)
+        available = self.capacity * (self.max_soc - self.current_soc)
+
+        if self.current_soc < 0.3:  # Low SOC condition
+            return min(self.charge_rate, available)
         elif self.current_soc > 0.8:  # High SOC condition
             return -min(self.charge_rate, consumption)
         else:
             if 0 <= hour < 6:  # Night charging
-                return min(self.charge_rate * 0.8,
-                           self.get_available_capacity())
+                return min(self.charge_rate * 0.8, available)
             elif 10 <= hour < 16:  # Day discharge
                 return -min(self.charge_rate * 0.6, consumption)
             else:  # Evening/morning
@@ -188,6 +255,10 @@ class Battery:
         """Calculate effective price including surcharge"""
         return round(base_price + self.surcharge_rate, 3)
 
+    def get_effective_price_array(self, prices: np.ndarray) -> np.ndarray:
+        """Calculate effective prices including surcharge for an array of prices"""
+        return np.asarray(prices, dtype=np.float64) + self._surcharge_rate_f
+
     def get_consumption_confidence_intervals(self,
                                              date: Optional[datetime] = None
                                              ) -> Dict[str, float]:
@@ -203,3 +274,17 @@ class Battery:
             'lower_95': base_consumption - (1.96 * std_dev),
             'upper_95': base_consumption + (1.96 * std_dev)
         }
+
+    def get_consumption_confidence_intervals_range(
+            self, dates: pd.DatetimeIndex) -> Dict[str, np.ndarray]:
+        """Calculate consumption confidence intervals for a range of dates"""
+        months = pd.DatetimeIndex(dates).month.to_numpy()
+        base_consumption = (self.yearly_consumption /
+                            365.0) * self._monthly_array[months]
+        std_dev = base_consumption * 0.15
+
+        return {
+            'mean': base_consumption,
+            'lower_95': base_consumption - (1.96 * std_dev),
+            'upper_95': base_consumption + (1.96 * std_dev)
+        }
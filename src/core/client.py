@@ -18,6 +18,8 @@ The class provides the following methods:
 - `pause_battery()`: Pause the battery by forcing unload on low power.
 - `resume_battery()`: Resume from pause by removing the unload stratergy.
 - `actuals()`: Retrieves the actual values of the configured source types for all devices.
+- `invalidate_actuals()`: Forces the next `actuals()` call to poll the devices again.
+- `set_background_mode()`: Polls the devices at the slowest rate while the scheduler is idle.
 - `current_measurements()`: Retrieves the relevant actual values of the configured source types for the specified devices.
 """
 
@@ -31,6 +33,9 @@ from .const import (
     API_HOST_EU,
     AUTHENTICATION_PATH,
     ACTUALS_PATH,
+    ACTUALS_CACHE_TTL,
+    ACTUALS_CACHE_TTL_MIN,
+    ACTUALS_CACHE_TTL_MAX,
     AUTH_ACCESS_TOKEN,
     CUSTOMER_OVERVIEW_PATH,
     DEVICE_LIST_PATH,
@@ -82,6 +87,7 @@ class Client:
 
         self._username = username
         self._password = password
+        self._background = False
         self._clear()
 
     def _clear(self):
@@ -94,6 +100,10 @@ class Client:
         self._insights = None
         self._devices_insight = None
         self._devices_realtime = None
+        self._actuals = None
+        self._actuals_time = 0.0
+        self._actuals_ttl = ACTUALS_CACHE_TTL
+        self._actuals_hash = None
 
     async def authenticate(self) -> None:
         """Log in using username and password.
@@ -373,6 +383,9 @@ class Client:
         )
         if not success:
             self._strategy_info = None
+        else:
+            # The battery will follow the new strategy, so re-read its state
+            self.invalidate_actuals()
         return success
 
     async def clear_charge_strategy(self,
@@ -536,12 +549,20 @@ class Client:
         )
         return await self.set_strategy_info(info, deviceId)
 
-    async def actuals(self):
-        """Request the actual values of the sources of the types configured in this instance (source_types)."""
+    async def actuals(self, cache: bool = True):
+        """Request the actual values of the sources of the types configured in this instance (source_types).
+
+        Fetched values are reused for an adaptive time: it grows while the battery
+        state stays the same and shrinks back as soon as it changes."""
         if not self.is_authenticated():
             raise EcactusEcosUnauthenticatedException(
                 "Authentication required")
 
+        ttl = ACTUALS_CACHE_TTL_MAX if self._background else self._actuals_ttl
+        if (cache and self._actuals is not None
+                and time.monotonic() - self._actuals_time < ttl):
+            return self._actuals
+
         if not self._devices:
             await self.device_overview()
 
@@ -559,8 +580,26 @@ class Client:
                 data={"deviceId": device_id},
                 callback=self._handle_data_response,
             )
+        self._actuals = actuals
+        self._actuals_time = time.monotonic()
+        self._adapt_actuals_ttl(actuals)
         return actuals
 
+    def _adapt_actuals_ttl(self, actuals):
+        """Widen the actuals cache time while the battery state is stable"""
+        state_hash = hash(
+            tuple((device_id, round(actual.get("batterySoc") or 0.0, 4),
+                   round(actual.get("batteryPower") or 0.0, 1))
+                  for device_id, actual in actuals.items()))
+        # The first fetch only seeds the hash and keeps ACTUALS_CACHE_TTL
+        if self._actuals_hash is not None:
+            if state_hash == self._actuals_hash:
+                self._actuals_ttl = min(ACTUALS_CACHE_TTL_MAX,
+                                        self._actuals_ttl * 1.5)
+            else:
+                self._actuals_ttl = ACTUALS_CACHE_TTL_MIN
+        self._actuals_hash = state_hash
+
     async def current_measurements(self, deviceIds=None):
         """Wrapper method which returns the relevant actual values of sources.
 
@@ -719,6 +758,16 @@ class Client:
         """Invalidate the current authentication tokens and account details."""
         self._clear()
 
+    def invalidate_actuals(self):
+        """Invalidate the cached actual values, the next request polls the devices."""
+        self._actuals = None
+        self._actuals_time = 0.0
+        self._actuals_ttl = ACTUALS_CACHE_TTL_MIN
+
+    def set_background_mode(self, background: bool = True):
+        """Poll the devices at the slowest rate while the scheduler is idle."""
+        self._background = background
+
     def get_device(self, device_id):
         """Gets the id of the device which belongs to the given source type, if present."""
         return (self._devices[device_id] if self._devices is not None
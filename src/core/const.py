@@ -41,6 +41,15 @@ DEVICE_INSIGHT_PATH = "/api/client/insight/compute/latestDayDeviceEnergy"
 DEVICE_REALTIME_PATH = "/api/client/home/now/device/realtime"
 """Path to the realtime data for this day"""
 
+ACTUALS_CACHE_TTL = 5
+"""Seconds the actual values are reused before the devices are polled again"""
+
+ACTUALS_CACHE_TTL_MIN = 2
+"""Lower bound of the adaptive actuals cache time while the battery state changes"""
+
+ACTUALS_CACHE_TTL_MAX = 60
+"""Upper bound of the adaptive actuals cache time while the battery state is stable"""
+
 SURCHARGE_KWH = 0
 """The surcharge per kwh"""
 
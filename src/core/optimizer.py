@@ -10,6 +10,7 @@ from datetime import datetime
 from pandas.core.series import missing
 
 from .battery import Battery
+from .price_data import get_price_forecast_confidence_series
 from .optimize_result import OptimizeResult
 
 
@@ -52,31 +53,14 @@ class Optimizer:
         optimize_cost = 0.0
 
         # Calculate effective prices with confidence weighting
-        def calculate_effective_price(price: float, date: Any) -> float:
-            try:
-                # Handle different date input types
-                if isinstance(date, (str, int, float)):
-                    date_ts = pd.to_datetime(date)
-                else:
-                    date_ts = pd.Timestamp(date)
-
-                if isinstance(date_ts, pd.Timestamp):
-                    if pd.isna(date_ts):
-                        return float(price)
-                    confidence = self._get_price_forecast_confidence(
-                        date_ts.to_pydatetime())
-                    effective_price = self.battery.get_effective_price(
-                        float(price), date_ts.hour)
-                    return float(effective_price) * (0.9 + 0.1 * confidence)
-                return float(price)
-            except Exception as e:
-                print(f"Error calculating effective price: {str(e)}")
-                return float(price)
-
-        effective_prices = pd.Series([
-            calculate_effective_price(price, date)
-            for price, date in zip(prices.values, prices.index)
-        ],
+        dates = pd.to_datetime(prices.index)
+        now = datetime.now(dates.tz)
+        confidence = get_price_forecast_confidence_series(dates, now)
+        effective_prices = self.battery.get_effective_price_array(
+            prices.values) * (0.9 + 0.1 * confidence)
+        # Keep the plain price for missing timestamps
+        effective_prices = pd.Series(np.where(
+            dates.isna(), prices.values.astype(np.float64), effective_prices),
                                      index=prices.index)
 
         # Calculate daily thresholds
@@ -88,6 +72,9 @@ class Optimizer:
             for date in unique_dates
         }
 
+        hourly_consumption = self.battery.get_hourly_consumption_for_dates(
+            dates)
+
         current_soc = self.battery.current_soc
         predicted_soc[0] = current_soc
         daily_events = {}
@@ -107,7 +94,6 @@ class Optimizer:
                     continue
 
                 current_date = current_datetime.date()
-                current_hour = current_datetime.hour
             except Exception as e:
                 print(f"Error processing datetime at index {i}: {str(e)}")
                 continue
@@ -130,11 +116,7 @@ class Optimizer:
                 remaining_cycles, thresholds)
 
             # Update statistics and state
-            consumption_datetime = current_datetime.to_pydatetime(
-            ) if isinstance(current_datetime,
-                            pd.Timestamp) else current_datetime
-            current_hour_consumption = self.battery.get_hourly_consumption(
-                current_hour, consumption_datetime)
+            current_hour_consumption = hourly_consumption[i]
             net_consumption = max(0, current_hour_consumption - current_pv)
             consumption += net_consumption
             consumption_cost += prices.iloc[i] * net_consumption
@@ -159,21 +141,12 @@ class Optimizer:
     def _analyze_consumption_patterns(self,
                                       dates: List[datetime]) -> pd.DataFrame:
         """Analyze consumption patterns and return statistical metrics"""
-        consumptions = []
-        for date in dates:
-            daily_consumption = self.battery.get_daily_consumption_for_date(
-                date)
-            consumptions.append({
-                'date': date,
-                'consumption': daily_consumption
-            })
-        return pd.DataFrame(consumptions)
-
-    def _get_price_forecast_confidence(self, date: datetime) -> float:
-        """Calculate confidence factor for price forecasts"""
-        # Simple confidence calculation - can be extended
-        hours_ahead = (date - datetime.now()).total_seconds() / 3600
-        return max(0.5, 1 - (hours_ahead / 48))
+        intervals = self.battery.get_consumption_confidence_intervals_range(
+            pd.DatetimeIndex(dates))
+        return pd.DataFrame({
+            'date': dates,
+            'consumption': intervals['mean']
+        })
 
     def _calculate_price_thresholds(self, effective_prices: pd.Series,
                                     date: datetime) -> Dict[str, float]:
@@ -327,8 +300,8 @@ class Optimizer:
                     schedule[j] = 0
 
         new_soc = current_soc + net_soc_change
-        new_soc = np.clip(new_soc, self.battery.empty_soc,
-                          self.battery.max_soc)
+        new_soc = min(max(new_soc, self.battery.empty_soc),
+                      self.battery.max_soc)
 
         # Update predicted SOC for visualization
         for j in range(4):
@@ -336,8 +309,8 @@ class Optimizer:
             if point_index < len(predicted_soc):
                 progress_factor = (j + 1) / 4
                 interval_soc = current_soc + (net_soc_change * progress_factor)
-                predicted_soc[point_index] = np.clip(interval_soc,
-                                                     self.battery.empty_soc,
-                                                     self.battery.max_soc)
+                predicted_soc[point_index] = min(
+                    max(interval_soc, self.battery.empty_soc),
+                    self.battery.max_soc)
 
         return new_soc
@@ -1,11 +1,12 @@
 """
 Energy price data management and forecasting
 """
-from datetime import datetime, timedelta
-import numpy as np
+from datetime import datetime
 import pandas as pd
 from typing import Optional
 
+from . import price_data
+
 class PriceService:
     """Energy price data service"""
     
@@ -28,39 +29,9 @@ class PriceService:
         """
         if forecast_hours is None:
             forecast_hours = 24
-            
-        now = datetime.now()
-        dates = pd.date_range(start=now, periods=forecast_hours, freq='h')
-        
-        # Create realistic daily price pattern
-        base_price = 0.10  # Base price €0.10/kWh
-        prices = []
-        
-        for date in dates:
-            hour = date.hour
-            # Early morning valley
-            if 0 <= hour < 6:
-                price = base_price * (0.7 + 0.1 * np.sin(hour))
-            # Morning peak
-            elif 6 <= hour < 10:
-                price = base_price * (1.3 + 0.2 * np.sin(hour))
-            # Midday moderate
-            elif 10 <= hour < 16:
-                price = base_price * (1.1 + 0.1 * np.sin(hour))
-            # Evening peak
-            elif 16 <= hour < 22:
-                price = base_price * (1.4 + 0.2 * np.sin(hour))
-            # Late evening decline
-            else:
-                price = base_price * (0.9 + 0.1 * np.sin(hour))
-                
-            # Add some random variation
-            price *= (1 + 0.1 * np.random.randn())
-            prices.append(max(0.05, price))  # Ensure minimum price
-            
-        return pd.Series(prices, index=dates)
-        
+
+        return price_data.get_day_ahead_prices(forecast_hours)
+
     def get_price_forecast_confidence(self, date: datetime) -> float:
         """Calculate confidence factor for price forecasts"""
-        hours_ahead = (date - datetime.now()).total_seconds() / 3600
-        return max(0.5, 1 - (hours_ahead / 48))
+        return price_data.get_price_forecast_confidence(date)
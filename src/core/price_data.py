@@ -12,45 +12,85 @@ def is_prices_available_for_tomorrow() -> bool:
 
 
 from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+import threading
 import pandas as pd
 import numpy as np
 
+# Shared random generator for the simulated price variation
+_RNG = np.random.default_rng()
+
+# Daily price pattern per hour of day: early morning valley, morning peak,
+# midday moderate, evening peak and late evening decline
+_PRICE_LEVEL = np.array([0.7] * 6 + [1.3] * 4 + [1.1] * 6 + [1.4] * 6 +
+                        [0.9] * 2)
+_PRICE_AMPLITUDE = np.array([0.1] * 6 + [0.2] * 4 + [0.1] * 6 + [0.2] * 6 +
+                            [0.1] * 2)
+
+# Generated prices per (hour, forecast_hours), reused until the hour changes
+_price_cache: Dict[Tuple[datetime, int], pd.Series] = {}
+_price_cache_lock = threading.Lock()
+
+
+def set_price_seed(seed: Optional[int] = None) -> None:
+    """Reseed the price generator, e.g. for reproducible simulations"""
+    global _RNG
+    _RNG = np.random.default_rng(seed)
+    with _price_cache_lock:
+        _price_cache.clear()
+
 
 def get_day_ahead_prices(forecast_hours: int = 24) -> pd.Series:
-    """Get day-ahead energy prices"""
+    """Get day-ahead energy prices, generated once per hour"""
     now = datetime.now()
+    current_hour = now.replace(minute=0, second=0, microsecond=0)
+    key = (current_hour, forecast_hours)
+    with _price_cache_lock:
+        cached = _price_cache.get(key)
+    if cached is not None:
+        return cached.copy()
+
     dates = pd.date_range(start=now, periods=forecast_hours, freq='h')
 
+    hours = dates.hour.to_numpy()
+
     # Create realistic daily price pattern
     base_price = 0.10  # Base price €0.10/kWh
-    prices = []
-
-    for date in dates:
-        hour = date.hour
-        # Early morning valley
-        if 0 <= hour < 6:
-            price = base_price * (0.7 + 0.1 * np.sin(hour))
-        # Morning peak
-        elif 6 <= hour < 10:
-            price = base_price * (1.3 + 0.2 * np.sin(hour))
-        # Midday moderate
-        elif 10 <= hour < 16:
-            price = base_price * (1.1 + 0.1 * np.sin(hour))
-        # Evening peak
-        elif 16 <= hour < 22:
-            price = base_price * (1.4 + 0.2 * np.sin(hour))
-        # Late evening decline
-        else:
-            price = base_price * (0.9 + 0.1 * np.sin(hour))
-
-        # Add some random variation
-        price *= (1 + 0.1 * np.random.randn())
-        prices.append(max(0.05, price))  # Ensure minimum price
-
-    return pd.Series(prices, index=dates)
+    prices = np.sin(hours)
+    prices *= _PRICE_AMPLITUDE[hours]
+    prices += _PRICE_LEVEL[hours]
+
+    # Add some random variation, base_price * (1 + N(0, 0.1)) in one draw
+    prices *= _RNG.normal(base_price, 0.1 * base_price, size=len(dates))
+    np.maximum(prices, 0.05, out=prices)  # Ensure minimum price
+
+    prices = pd.Series(prices, index=dates)
+
+    with _price_cache_lock:
+        expired = current_hour - timedelta(hours=2)
+        for old_key in [k for k in _price_cache if k[0] <= expired]:
+            del _price_cache[old_key]
+        _price_cache[key] = prices
+    return prices.copy()
 
 
 def get_price_forecast_confidence(date: datetime) -> float:
     """Calculate confidence factor for price forecasts"""
     hours_ahead = (date - datetime.now()).total_seconds() / 3600
     return max(0.5, 1 - (hours_ahead / 48))
+
+
+def get_price_forecast_confidence_series(
+        dates: pd.DatetimeIndex,
+        now: Optional[datetime] = None) -> np.ndarray:
+    """Calculate confidence factors for price forecasts of a range of dates"""
+    dates = pd.DatetimeIndex(dates)
+    if now is None:
+        now = datetime.now(dates.tz)
+    elif dates.tz is not None and now.tzinfo is None:
+        # A naive now is local time, align it with the timezone of the index
+        now = now.astimezone(dates.tz)
+    elif dates.tz is None and now.tzinfo is not None:
+        now = now.astimezone().replace(tzinfo=None)
+    hours_ahead = (dates - now).total_seconds().to_numpy() / 3600
+    return np.maximum(0.5, 1 - (hours_ahead / 48))
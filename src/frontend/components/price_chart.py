@@ -3,7 +3,7 @@ import plotly.graph_objects as go
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from core.price_data import get_price_forecast_confidence, is_prices_available_for_tomorrow
+from core.price_data import get_price_forecast_confidence_series, is_prices_available_for_tomorrow
 from core.weather import WeatherService
 import logging
 from frontend.translations import get_text
@@ -11,6 +11,11 @@ from frontend.translations import get_text
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Price period per hour of day: 0 = off-peak, 1 = shoulder, 2 = peak
+_HOUR_CLASS = np.zeros(24, dtype=np.int8)
+_HOUR_CLASS[[10, 11, 12, 13, 14, 15, 16]] = 1
+_HOUR_CLASS[[7, 8, 9, 17, 18, 19, 20]] = 2
+
 
 # Cache the base figure layout
 @st.cache_data(ttl=3600)
@@ -75,11 +80,19 @@ def get_price_colors(_dates, _prices):
     # Calculate price percentiles for dynamic thresholds
     price_75th = np.percentile(_prices, 75)
     price_25th = np.percentile(_prices, 25)
-
-    for date, price in zip(_dates, _prices):
-        hour = date.hour
-        confidence = get_price_forecast_confidence(date)
-
+    # Ensure confidence is in [0,1]
+    confidences = np.clip(get_price_forecast_confidence_series(_dates), 0,
+                          1.0)
+
+    # Updated opacity settings for better visualization
+    hour_class = _HOUR_CLASS[pd.DatetimeIndex(_dates).hour.to_numpy()]
+    opacities = np.choose(hour_class, [
+        np.clip(confidences * 0.25, 0.08, 1.0),  # Off-peak hours
+        np.clip(confidences * 0.3, 0.1, 1.0),  # Shoulder hours
+        np.clip(confidences * 0.4, 0.15, 1.0)  # Peak hours
+    ])
+
+    for price, opacity in zip(_prices, opacities):
         # Dynamic color assignment based on both time and price
         if price >= price_75th:
             base_color = "rgba(255, 99, 71, {opacity})"  # Peak (red)
@@ -88,16 +101,6 @@ def get_price_colors(_dates, _prices):
         else:
             base_color = "rgba(255, 165, 0, {opacity})"  # Shoulder (orange)
 
-        # Updated opacity settings for better visualization
-        confidence = np.clip(confidence, 0,
-                             1.0)  # Ensure confidence is in [0,1]
-        if hour in [7, 8, 9, 17, 18, 19, 20]:
-            opacity = np.clip(confidence * 0.4, 0.15, 1.0)  # Peak hours
-        elif hour in [10, 11, 12, 13, 14, 15, 16]:
-            opacity = np.clip(confidence * 0.3, 0.1, 1.0)  # Shoulder hours
-        else:
-            opacity = np.clip(confidence * 0.25, 0.08, 1.0)  # Off-peak hours
-
         colors.append(base_color.format(opacity=opacity))
 
     return colors
@@ -126,6 +129,10 @@ def render_price_chart(prices,
         # Get cached price period colors with price-sensitive coloring
         colors = get_price_colors(prices.index, prices.values)
 
+        # Calculate confidence levels for all points and clip them to [0,1] range
+        confidence = np.clip(
+            get_price_forecast_confidence_series(prices.index), 0, 1.0)
+
         # Add price bars first (for proper rendering order)
         chunk_size = 12  # Hours per chunk
         for i in range(0, len(prices), chunk_size):
@@ -134,11 +141,7 @@ def render_price_chart(prices,
             chunk_colors = colors[i:i + chunk_size]
             chunk_dates = prices.index[chunk_slice]
 
-            # Calculate confidence levels for each point and clip them to [0,1] range
-            confidence_levels = [
-                np.clip(get_price_forecast_confidence(date), 0, 1.0)
-                for date in chunk_dates
-            ]
+            confidence_levels = confidence[chunk_slice].tolist()
 
             fig.add_trace(
                 go.Bar(
@@ -189,10 +192,8 @@ def render_price_chart(prices,
         # Add home usage line if battery is in session state
         if 'battery' in st.session_state:
             battery = st.session_state.battery
-            home_usage = [
-                battery.get_hourly_consumption(date.hour, date)
-                for date in prices.index
-            ]
+            home_usage = battery.get_hourly_consumption_for_dates(
+                prices.index)
 
             fig.add_trace(
                 go.Scatter(x=prices.index,